@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the SEO Page Generator backend.
+Measures cold import time of main.py and the latency of the first requests,
+each run in a fresh interpreter so nothing is already cached.
+
+Usage:
+    python benchmark_startup.py [--runs 5] [--max-import-ms 1500]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent
+
+# Executed in a child interpreter; prints one JSON line of timings (in ms)
+PROBE = """
+import json
+import sys
+import time
+
+sys.path.insert(0, {backend_dir!r})
+
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+
+from fastapi.testclient import TestClient
+
+timings = {{"import_ms": (t1 - t0) * 1000}}
+with TestClient(main.app) as client:
+    t2 = time.perf_counter()
+    timings["lifespan_ms"] = (t2 - t1) * 1000
+
+    client.get("/")
+    t3 = time.perf_counter()
+    timings["first_request_ms"] = (t3 - t2) * 1000
+
+    client.get("/products")
+    t4 = time.perf_counter()
+    timings["first_db_request_ms"] = (t4 - t3) * 1000
+
+print(json.dumps(timings))
+"""
+
+def run_probe(workdir: Path) -> dict:
+    """Run one cold start in a fresh interpreter with a throwaway database"""
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{workdir / 'benchmark.db'}"
+    # Startup requires a key; it is never used since no content is generated
+    env.setdefault("OPENAI_API_KEY", "benchmark-placeholder")
+
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(backend_dir=str(BACKEND_DIR))],
+        cwd=workdir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark backend cold start")
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts to measure")
+    parser.add_argument("--max-import-ms", type=float, default=None,
+                        help="Exit non-zero if the median import time exceeds this")
+    args = parser.parse_args()
+
+    samples = []
+    for i in range(args.runs):
+        with tempfile.TemporaryDirectory() as tmp:
+            samples.append(run_probe(Path(tmp)))
+        print(f"⏱️  Run {i + 1}/{args.runs}: import {samples[-1]['import_ms']:.1f} ms")
+
+    print("-" * 50)
+    print(f"{'metric':<22}{'median':>10}{'min':>10}{'max':>10}")
+    medians = {}
+    for metric in samples[0]:
+        values = [sample[metric] for sample in samples]
+        medians[metric] = statistics.median(values)
+        print(f"{metric:<22}{medians[metric]:>10.1f}{min(values):>10.1f}{max(values):>10.1f}")
+
+    if args.max_import_ms is not None and medians["import_ms"] > args.max_import_ms:
+        print(f"❌ Median import time {medians['import_ms']:.1f} ms exceeds {args.max_import_ms:.1f} ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
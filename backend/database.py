@@ -1,4 +1,6 @@
 import os
+import threading
+from functools import lru_cache
 from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, JSON
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -9,11 +11,17 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./seo_generator.db")
 
-engine = create_engine(
-    DATABASE_URL, 
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@lru_cache(maxsize=None)
+def get_engine():
+    """Create the engine on first use so importing this module stays cheap"""
+    return create_engine(
+        DATABASE_URL, 
+        connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    )
+
+@lru_cache(maxsize=None)
+def get_sessionmaker():
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
 Base = declarative_base()
 
@@ -41,11 +49,31 @@ class Product(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+_tables_lock = threading.Lock()
+_tables_created = False
+
 def create_tables():
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
+
+def ensure_tables():
+    """Create tables once per process, on the first request that needs the database"""
+    global _tables_created
+    
+    if _tables_created:
+        return
+    with _tables_lock:
+        if not _tables_created:
+            create_tables()
+            _tables_created = True
+
+def dispose_engine():
+    """Release pooled connections if the engine was ever created"""
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
 
 def get_db():
-    db = SessionLocal()
+    ensure_tables()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
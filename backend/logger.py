@@ -1,11 +1,27 @@
 import logging
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
+_setup_lock = threading.Lock()
+_configured = False
+
 def setup_logger():
-    """Set up comprehensive logging for the SEO Page Generator"""
+    """Set up comprehensive logging for the SEO Page Generator.
+
+    Safe to call more than once; handlers are only installed on the first call.
+    """
+    global _configured
     
+    with _setup_lock:
+        if not _configured:
+            _configure_handlers()
+            _configured = True
+    
+    return logging.getLogger("seo_generator")
+
+def _configure_handlers():
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
@@ -54,8 +70,7 @@ def setup_logger():
     # Set specific logger levels
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
-    
-    return logging.getLogger("seo_generator")
 
-# Create the main logger
-logger = setup_logger() 
\ No newline at end of file
+# The main logger; handlers are attached by setup_logger() from the app lifespan
+logger = logging.getLogger("seo_generator")
+ 
\ No newline at end of file
@@ -1,26 +1,51 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, HTTPException, Response, Request
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from typing import List
-import requests
 import os
 import time
-from urllib.parse import quote
 
-from database import get_db, create_tables, Product
+from database import get_db, dispose_engine, Product
 from models import ProductInput, ProductResponse, GenerateResponse
-from seo_generator import SEOContentGenerator
-from logger import logger
+from seo_generator import SEOContentGenerator, get_seo_generator
+from sitemap_notifier import SitemapNotifier, get_sitemap_notifier, close_sitemap_notifier
+from logger import logger, setup_logger
 
-# Create tables on startup
-logger.info("🚀 Initializing SEO Page Generator API...")
-create_tables()
-logger.info("✅ Database tables created/verified")
+# CORS configuration - Allow frontend URL from environment
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
+
+allowed_origins = [
+    "http://localhost:5173", 
+    "http://localhost:3000",  # SvelteKit dev servers
+    FRONTEND_URL  # Production frontend URL
+]
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Keep startup cheap: the database and OpenAI client initialize on first use"""
+    setup_logger()
+    logger.info("🚀 Initializing SEO Page Generator API...")
+    
+    # Fail fast on missing or invalid configuration; heavy clients are still created on first use
+    get_seo_generator()
+    get_sitemap_notifier()
+    
+    logger.info(f"🌐 CORS: FRONTEND_URL = {FRONTEND_URL}")
+    logger.info(f"🌐 CORS: Allowed origins = {allowed_origins}")
+    logger.info("✅ API ready (database and AI client initialize on first use)")
+    
+    yield
+    
+    logger.info("👋 Shutting down SEO Page Generator API...")
+    await close_sitemap_notifier()
+    dispose_engine()
 
 app = FastAPI(
     title="SEO Page Generator API",
     description="AI-powered SEO page generator for products and services",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Request logging middleware
@@ -40,18 +65,7 @@ async def log_requests(request: Request, call_next):
     
     return response
 
-# CORS middleware - Allow frontend URL from environment
-FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
-logger.info(f"🌐 CORS: FRONTEND_URL = {FRONTEND_URL}")
-
-allowed_origins = [
-    "http://localhost:5173", 
-    "http://localhost:3000",  # SvelteKit dev servers
-    FRONTEND_URL  # Production frontend URL
-]
-
-logger.info(f"🌐 CORS: Allowed origins = {allowed_origins}")
-
+# CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Temporary: Allow all origins for testing
@@ -60,22 +74,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize SEO generator
-logger.info("🤖 Initializing SEO Content Generator...")
-try:
-    seo_generator = SEOContentGenerator()
-    logger.info("✅ SEO Content Generator initialized successfully")
-except Exception as e:
-    logger.error(f"❌ Failed to initialize SEO Content Generator: {e}")
-    raise
-
 @app.get("/")
 async def root():
     logger.info("🏠 Root endpoint accessed")
     return {"message": "SEO Page Generator API", "version": "1.0.0", "status": "healthy"}
 
 @app.post("/generate", response_model=GenerateResponse)
-async def generate_seo_page(product_input: ProductInput, db: Session = Depends(get_db)):
+async def generate_seo_page(
+    product_input: ProductInput,
+    db: Session = Depends(get_db),
+    seo_generator: SEOContentGenerator = Depends(get_seo_generator),
+    sitemap_notifier: SitemapNotifier = Depends(get_sitemap_notifier)
+):
     """Generate SEO-optimized page content for a product"""
     logger.info(f"🚀 Starting SEO page generation for: {product_input.name}")
     
@@ -110,6 +120,7 @@ async def generate_seo_page(product_input: ProductInput, db: Session = Depends(g
             
             db.commit()
             db.refresh(existing_product)
+            sitemap_notifier.notify_changed()
             logger.info(f"✅ Product updated successfully: {existing_product.name}")
             
             return GenerateResponse(
@@ -140,6 +151,7 @@ async def generate_seo_page(product_input: ProductInput, db: Session = Depends(g
             db.add(db_product)
             db.commit()
             db.refresh(db_product)
+            sitemap_notifier.notify_changed()
             logger.info(f"✅ New product created successfully: {db_product.name} (ID: {db_product.id})")
             
             return GenerateResponse(
@@ -208,33 +220,31 @@ async def get_sitemap(db: Session = Depends(get_db)):
     return Response(content=sitemap_xml, media_type="application/xml")
 
 @app.post("/ping-google")
-async def ping_google_sitemap():
-    """Notify Google about sitemap updates"""
-    logger.info("📡 Pinging Google for sitemap update")
+async def ping_google_sitemap(sitemap_notifier: SitemapNotifier = Depends(get_sitemap_notifier)):
+    """Notify search engines about sitemap updates immediately.
+
+    Catalog changes already trigger a debounced ping; this flushes it now.
+    """
+    logger.info("📡 Manual sitemap ping requested")
     
-    try:
-        base_url = os.getenv("BASE_URL", "http://localhost:8000")
-        sitemap_url = f"{base_url}/sitemap.xml"
-        google_ping_url = f"http://www.google.com/ping?sitemap={quote(sitemap_url)}"
-        
-        logger.info(f"🔗 Sitemap URL: {sitemap_url}")
-        logger.info(f"📤 Pinging Google at: {google_ping_url}")
-        
-        response = requests.get(google_ping_url)
-        
-        if response.status_code == 200:
-            logger.info("✅ Successfully pinged Google")
-            return {"success": True, "message": "Successfully pinged Google about sitemap update"}
-        else:
-            logger.warning(f"⚠️ Google ping failed with status: {response.status_code}")
-            return {"success": False, "message": f"Failed to ping Google: {response.status_code}"}
-            
-    except Exception as e:
-        logger.error(f"❌ Error pinging Google: {str(e)}", exc_info=True)
-        return {"success": False, "message": f"Error pinging Google: {str(e)}"}
+    results = await sitemap_notifier.ping_now()
+    failed = [result for result in results if not result["success"]]
+    
+    if not failed:
+        return {"success": True, "message": "Successfully pinged search engines about sitemap update", "results": results}
+    return {"success": False, "message": f"Failed to ping {len(failed)} of {len(results)} endpoint(s)", "results": results}
+
+@app.get("/sitemap-ping/status")
+async def get_sitemap_ping_status(sitemap_notifier: SitemapNotifier = Depends(get_sitemap_notifier)):
+    """Get the state of debounced sitemap notifications"""
+    return sitemap_notifier.status()
 
 @app.delete("/product/{slug}")
-async def delete_product(slug: str, db: Session = Depends(get_db)):
+async def delete_product(
+    slug: str,
+    db: Session = Depends(get_db),
+    sitemap_notifier: SitemapNotifier = Depends(get_sitemap_notifier)
+):
     """Delete a product by slug"""
     logger.info(f"🗑️ Attempting to delete product with slug: {slug}")
     
@@ -246,14 +256,15 @@ async def delete_product(slug: str, db: Session = Depends(get_db)):
     product_name = product.name
     db.delete(product)
     db.commit()
+    sitemap_notifier.notify_changed()
     
     logger.info(f"✅ Product deleted successfully: {product_name}")
     return {"success": True, "message": "Product deleted successfully"}
 
 if __name__ == "__main__":
     import uvicorn
-    import os
     
+    setup_logger()
     port = int(os.getenv("PORT", 8000))
     logger.info(f"🌐 Starting FastAPI server on http://0.0.0.0:{port}")
     uvicorn.run(app, host="0.0.0.0", port=port) 
\ No newline at end of file
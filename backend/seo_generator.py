@@ -2,8 +2,9 @@ import os
 import json
 import re
 import logging
+import threading
+from functools import lru_cache
 from typing import Dict, Any, List
-from openai import OpenAI
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,9 +17,21 @@ class SEOContentGenerator:
             logger.error("❌ OPENAI_API_KEY not found in environment variables")
             raise ValueError("OPENAI_API_KEY is required")
         
-        logger.info("🔑 Initializing OpenAI client...")
-        self.client = OpenAI(api_key=api_key)
-        logger.info("✅ OpenAI client initialized successfully")
+        self._api_key = api_key
+        self._client = None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def client(self):
+        """OpenAI client, imported and constructed on first use"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    logger.info("🔑 Initializing OpenAI client...")
+                    from openai import OpenAI
+                    self._client = OpenAI(api_key=self._api_key)
+                    logger.info("✅ OpenAI client initialized successfully")
+        return self._client
         
     def generate_slug(self, name: str) -> str:
         """Generate URL-friendly slug from product name"""
@@ -204,4 +217,16 @@ Make sure the content is engaging, keyword-optimized, and designed to rank well
         }
         
         logger.info(f"✅ Fallback content generated successfully for: {product_input['name']}")
-        return fallback_content 
\ No newline at end of file
+        return fallback_content 
+
+@lru_cache(maxsize=None)
+def get_seo_generator() -> SEOContentGenerator:
+    """Shared generator instance, created on the first request that needs it"""
+    logger.info("🤖 Initializing SEO Content Generator...")
+    try:
+        generator = SEOContentGenerator()
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize SEO Content Generator: {e}")
+        raise
+    logger.info("✅ SEO Content Generator initialized successfully")
+    return generator
@@ -0,0 +1,207 @@
+import os
+import asyncio
+import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+from urllib.parse import quote
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger("seo_generator")
+
+DEFAULT_PING_ENDPOINTS = "http://www.google.com/ping?sitemap={sitemap}"
+
+# In-process stand-in for search engines, selected with SITEMAP_PING_ENDPOINTS=local
+LOCAL_PING_HOST = "http://sitemap-ping.local"
+LOCAL_PING_ENDPOINT = LOCAL_PING_HOST + "/ping?sitemap={sitemap}"
+
+def _local_ping_handler(request: "httpx.Request") -> "httpx.Response":
+    import httpx
+    
+    logger.info(f"🧪 Local ping stand-in received: {request.url}")
+    return httpx.Response(200, text="Sitemap notification received")
+
+def parse_endpoints(value: str) -> List[str]:
+    """Parse a comma-separated list of ping URL templates containing '{sitemap}'"""
+    endpoints = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        endpoint = LOCAL_PING_ENDPOINT if item == "local" else item
+        
+        # Templates may only use the {sitemap} placeholder
+        try:
+            formatted = endpoint.format(sitemap="")
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError(f"Invalid sitemap ping endpoint {endpoint!r}: only {{sitemap}} is allowed ({e!r})")
+        if formatted == endpoint:
+            raise ValueError(f"Invalid sitemap ping endpoint {endpoint!r}: missing {{sitemap}} placeholder")
+        
+        endpoints.append(endpoint)
+    return endpoints
+
+class SitemapNotifier:
+    """Notifies search engines about sitemap changes.
+
+    Catalog changes call notify_changed(); pings are debounced so a burst of
+    changes results in a single notification once things have been quiet for
+    `debounce_seconds`. A steady trickle of changes cannot postpone the ping
+    indefinitely: it fires at most `max_wait_multiplier` x `debounce_seconds`
+    after the first pending change. Endpoints are pinged concurrently over one
+    shared client.
+    """
+
+    def __init__(
+        self,
+        sitemap_url: str,
+        endpoints: List[str],
+        debounce_seconds: float = 30.0,
+        max_wait_multiplier: float = 10.0,
+        timeout_seconds: float = 10.0,
+        transport: Optional["httpx.AsyncBaseTransport"] = None
+    ):
+        self.sitemap_url = sitemap_url
+        self.endpoints = endpoints
+        self.debounce_seconds = debounce_seconds
+        self.max_wait_seconds = max_wait_multiplier * debounce_seconds
+        self.timeout_seconds = timeout_seconds
+        self._transport = transport
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._timer: Optional[asyncio.Task] = None
+        self._first_pending_at: Optional[float] = None
+        self._ping_lock = asyncio.Lock()
+
+        self.pending_changes = 0
+        self.total_changes = 0
+        self.total_pings = 0
+        self.last_change_at: Optional[datetime] = None
+        self.last_ping_at: Optional[datetime] = None
+        self.last_results: List[Dict[str, Any]] = []
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Shared HTTP client, imported and created on first ping so connections are reused"""
+        if self._client is None:
+            import httpx
+            
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                transport=self._transport,
+                mounts={LOCAL_PING_HOST: httpx.MockTransport(_local_ping_handler)}
+            )
+        return self._client
+
+    def notify_changed(self):
+        """Record a catalog change and (re)start the debounce timer"""
+        loop = asyncio.get_running_loop()
+        if self.pending_changes == 0:
+            self._first_pending_at = loop.time()
+        self.pending_changes += 1
+        self.total_changes += 1
+        self.last_change_at = datetime.utcnow()
+
+        # Wait for quiet, but never past the max-wait deadline of the first pending change
+        deadline = self._first_pending_at + self.max_wait_seconds
+        delay = max(0.0, min(self.debounce_seconds, deadline - loop.time()))
+
+        if self._timer is not None and not self._timer.done():
+            self._timer.cancel()
+        self._timer = loop.create_task(self._ping_after_debounce(delay))
+        logger.debug(f"🗺️ Sitemap change recorded ({self.pending_changes} pending)")
+
+    async def _ping_after_debounce(self, delay: float):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            return
+        # Detach before pinging so a change arriving mid-ping schedules a new
+        # timer instead of cancelling this in-flight ping
+        self._timer = None
+        await self.ping_now()
+
+    async def ping_now(self) -> List[Dict[str, Any]]:
+        """Ping every endpoint immediately, clearing any pending debounced ping"""
+        if self._timer is not None and not self._timer.done():
+            self._timer.cancel()
+            self._timer = None
+
+        async with self._ping_lock:
+            coalesced = self.pending_changes
+            self.pending_changes = 0
+            self._first_pending_at = None
+            logger.info(f"📡 Pinging {len(self.endpoints)} endpoint(s) for sitemap update ({coalesced} change(s))")
+
+            results = await asyncio.gather(*(self._ping(endpoint) for endpoint in self.endpoints))
+
+            self.total_pings += 1
+            self.last_ping_at = datetime.utcnow()
+            self.last_results = list(results)
+            return self.last_results
+
+    async def _ping(self, endpoint: str) -> Dict[str, Any]:
+        # Never raise: one bad endpoint must not fail the whole batch
+        url = endpoint
+        try:
+            url = endpoint.format(sitemap=quote(self.sitemap_url, safe=""))
+            response = await self.client.get(url)
+        except Exception as e:
+            logger.warning(f"⚠️ Sitemap ping to {url} failed: {e!r}")
+            return {"endpoint": url, "success": False, "status_code": None, "error": repr(e)}
+
+        success = response.status_code == 200
+        if success:
+            logger.info(f"✅ Sitemap ping to {url} succeeded")
+        else:
+            logger.warning(f"⚠️ Sitemap ping to {url} failed with status: {response.status_code}")
+        return {"endpoint": url, "success": success, "status_code": response.status_code, "error": None}
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "sitemap_url": self.sitemap_url,
+            "endpoints": self.endpoints,
+            "debounce_seconds": self.debounce_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+            "ping_scheduled": self._timer is not None and not self._timer.done(),
+            "pending_changes": self.pending_changes,
+            "total_changes": self.total_changes,
+            "total_pings": self.total_pings,
+            "last_change_at": self.last_change_at,
+            "last_ping_at": self.last_ping_at,
+            "last_results": self.last_results,
+        }
+
+    async def aclose(self):
+        """Flush a pending ping (so scale-down doesn't drop it) and close the client"""
+        if self.pending_changes:
+            await self.ping_now()
+        elif self._timer is not None and not self._timer.done():
+            self._timer.cancel()
+        
+        # A debounced ping may already be in flight (detached from _timer and
+        # holding the lock); let it finish before closing the shared client
+        async with self._ping_lock:
+            pass
+        
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+@lru_cache(maxsize=None)
+def get_sitemap_notifier() -> SitemapNotifier:
+    """Shared notifier configured from the environment"""
+    base_url = os.getenv("BASE_URL", "http://localhost:8000")
+    return SitemapNotifier(
+        sitemap_url=f"{base_url}/sitemap.xml",
+        endpoints=parse_endpoints(os.getenv("SITEMAP_PING_ENDPOINTS", DEFAULT_PING_ENDPOINTS)),
+        debounce_seconds=float(os.getenv("SITEMAP_PING_DEBOUNCE_SECONDS", 30)),
+        max_wait_multiplier=float(os.getenv("SITEMAP_PING_MAX_WAIT_MULTIPLIER", 10)),
+        timeout_seconds=float(os.getenv("SITEMAP_PING_TIMEOUT_SECONDS", 10))
+    )
+
+async def close_sitemap_notifier():
+    """Close the notifier if it was ever created"""
+    if get_sitemap_notifier.cache_info().currsize:
+        await get_sitemap_notifier().aclose()
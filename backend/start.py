@@ -4,24 +4,23 @@ Startup script for the SEO Page Generator backend.
 This script sets up the environment and starts the FastAPI server.
 """
 
+import importlib.util
 import os
 import sys
 from pathlib import Path
 
+REQUIRED_PACKAGES = ["fastapi", "uvicorn", "sqlalchemy", "openai", "httpx"]
+
 def check_requirements():
-    """Check if all required packages are installed"""
-    try:
-        import fastapi
-        import uvicorn
-        import sqlalchemy
-        import openai
-        import requests
-        print("✅ All required packages are installed")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing package: {e.name}")
-        print("Please run: pip install -r requirements.txt")
-        return False
+    """Check if all required packages are installed (without importing them)"""
+    for package in REQUIRED_PACKAGES:
+        if importlib.util.find_spec(package) is None:
+            print(f"❌ Missing package: {package}")
+            print("Please run: pip install -r requirements.txt")
+            return False
+    
+    print("✅ All required packages are installed")
+    return True
 
 def check_env_file():
     """Check if .env file exists and has required variables"""
@@ -60,14 +59,22 @@ def main():
     if not check_env_file():
         sys.exit(1)
     
+    host = os.getenv("HOST", "0.0.0.0")
+    port = int(os.getenv("PORT", 8000))
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
+    
     print("✅ All checks passed!")
-    print("🌐 Starting FastAPI server...")
-    print("📍 Backend will be available at: http://localhost:8000")
-    print("📚 API Documentation: http://localhost:8000/docs")
+    print(f"🌐 Starting FastAPI server with {workers} worker(s)...")
+    print(f"📍 Backend will be available at: http://localhost:{port}")
+    print(f"📚 API Documentation: http://localhost:{port}/docs")
     print("-" * 50)
     
-    # Start the server
-    os.system("python main.py")
+    # Start the server in this process instead of spawning a second interpreter
+    import uvicorn
+    from logger import setup_logger
+    
+    setup_logger()
+    uvicorn.run("main:app", host=host, port=port, workers=workers)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
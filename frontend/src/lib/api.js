@@ -38,10 +38,16 @@ export const productAPI = {
     return response.data;
   },
 
-  // Ping Google for sitemap
+  // Ping search engines for sitemap immediately (changes already trigger a debounced ping)
   async pingGoogle() {
     const response = await api.post('/ping-google');
     return response.data;
+  },
+
+  // Get sitemap notification status
+  async getSitemapPingStatus() {
+    const response = await api.get('/sitemap-ping/status');
+    return response.data;
   }
 };
 